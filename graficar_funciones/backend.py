@@ -6,20 +6,83 @@ La expresión es transformada mediante `sympify()` en un objeto simbólico de Sy
 Las funciones se grafican utilizando NumPy para la generación de puntos y Matplotlib para la representación gráfica.
 """
 
+import functools
+import linecache
+import threading
+from collections import OrderedDict
 import matplotlib.figure as mpl_figure
 import numpy as np
-from sympy import symbols, sympify, diff, Expr, integrate, latex
+from sympy import symbols, sympify, diff, Expr, integrate, latex, cancel, simplify, count_ops, Integral, Pow
 from sympy.utilities.lambdify import lambdify
 from typing import Callable
 
+try:
+    import numexpr
+except ImportError:  # numexpr es opcional: sin él se usa numba o NumPy
+    numexpr = None
+
+try:
+    import numba
+except ImportError:  # numba es opcional: sin él se usa la versión de NumPy
+    numba = None
+
 # Variable simbólica global usada para las expresiones
 var_x = symbols('x')
 
+# Tamaño máximo (en operaciones) de una expresión para intentar simplificarla o cancelarla
+_MAX_SIMPLIFY_OPS = 60
+
+# Exponente entero máximo para intentar `cancel()`, que expande las potencias
+_MAX_CANCEL_EXPONENT = 8
+
+# Caché LRU de funciones evaluables, indexada por la propia expresión simbólica. Se limita
+# porque cada entrada puede retener un ufunc compilado por numba con su módulo LLVM.
+_LAMBDIFY_CACHE_SIZE = 128
+_LAMBDIFY_CACHE: OrderedDict[Expr | tuple[Expr, ...], Callable] = OrderedDict()
+# La caché se consulta desde el hilo de trabajo y desde el hilo de la interfaz
+_LAMBDIFY_CACHE_LOCK = threading.Lock()
+
+
+def _cache_get(key: Expr | tuple[Expr, ...]) -> Callable | None:
+    """
+    Busca una función evaluable en la caché y la marca como usada recientemente.
+
+    Args:
+        key (sympy.Expr or tuple[sympy.Expr, ...]): Expresión o expresiones simbólicas.
+
+    Returns:
+        Callable | None: La función guardada, o None si no está en caché.
+    """
+    with _LAMBDIFY_CACHE_LOCK:
+        callable_function = _LAMBDIFY_CACHE.get(key)
+        if callable_function is not None:
+            _LAMBDIFY_CACHE.move_to_end(key)
+        return callable_function
+
+
+def _cache_put(key: Expr | tuple[Expr, ...], callable_function: Callable):
+    """
+    Guarda una función evaluable en la caché, descartando la menos usada si está llena.
 
+    Args:
+        key (sympy.Expr or tuple[sympy.Expr, ...]): Expresión o expresiones simbólicas.
+        callable_function (Callable): Función evaluable a guardar.
+    """
+    with _LAMBDIFY_CACHE_LOCK:
+        _LAMBDIFY_CACHE[key] = callable_function
+        _LAMBDIFY_CACHE.move_to_end(key)
+        if len(_LAMBDIFY_CACHE) > _LAMBDIFY_CACHE_SIZE:
+            _LAMBDIFY_CACHE.popitem(last=False)
+
+
+@functools.lru_cache(maxsize=128)
 def string_to_symbolic(string_function: str) -> Expr:
     """
     Convierte una cadena de texto a una expresión simbólica de SymPy.
 
+    Las expresiones de SymPy son inmutables, por lo que el resultado se guarda en caché
+    y volver a graficar el mismo texto no lo analiza de nuevo.
+
     Args:
         string_function (str): Expresión matemática como string.
 
@@ -29,6 +92,81 @@ def string_to_symbolic(string_function: str) -> Expr:
     return sympify(string_function)
 
 
+@functools.lru_cache(maxsize=128)
+def _shrink(symbolic_function: Expr) -> Expr:
+    """
+    Intenta reducir una expresión con `cancel()` antes de convertirla en función evaluable.
+
+    `cancel()` expande las potencias, así que no se intenta en expresiones grandes ni con
+    exponentes enteros altos, donde tardaría mucho más que el propio `lambdify()`.
+    El resultado se guarda en caché para no repetirlo con la misma expresión.
+
+    Args:
+        symbolic_function (sympy.Expr): Expresión simbólica.
+
+    Returns:
+        sympy.Expr: La versión cancelada si tiene menos operaciones; si no, la original.
+    """
+    ops = count_ops(symbolic_function)
+    if ops > _MAX_SIMPLIFY_OPS:
+        return symbolic_function
+    for power in symbolic_function.atoms(Pow):
+        if power.exp.is_Integer and abs(power.exp) > _MAX_CANCEL_EXPONENT:
+            return symbolic_function
+    try:
+        cancelled = cancel(symbolic_function)
+    except Exception:
+        return symbolic_function
+    if count_ops(cancelled) < ops:
+        return cancelled
+    return symbolic_function
+
+
+def _lambdify_numexpr(symbolic_function: Expr) -> Callable | None:
+    """
+    Convierte la expresión en una función que se evalúa con numexpr en una sola pasada.
+
+    Args:
+        symbolic_function (sympy.Expr): Expresión simbólica.
+
+    Returns:
+        Callable | None: Función evaluable, o None si numexpr no está disponible
+        o no soporta la expresión.
+    """
+    if numexpr is None:
+        return None
+    try:
+        # Sin cse: la impresora de numexpr de SymPy genera código inválido con él
+        function = lambdify(var_x, symbolic_function, "numexpr")
+        # numexpr solo detecta las funciones que no soporta al evaluar
+        function(np.ones(1))
+    except Exception:
+        return None
+    return function
+
+
+def _vectorize(symbolic_function: Expr) -> Callable | None:
+    """
+    Compila la expresión como un ufunc de numba a partir de su versión escalar con `math`.
+
+    Args:
+        symbolic_function (sympy.Expr): Expresión simbólica.
+
+    Returns:
+        Callable | None: Ufunc que recorre el array en un único bucle, o None si numba
+        no está disponible o no logra compilar la expresión.
+    """
+    if numba is None:
+        return None
+    scalar_function = lambdify(var_x, symbolic_function, ["math"], cse=True)
+    try:
+        # fastmath sin 'nnan' ni 'ninf': las funciones graficadas suelen producir NaN e infinitos
+        return numba.vectorize([numba.float64(numba.float64)], nopython=True,
+                               fastmath={"nsz", "arcp", "contract", "afn", "reassoc"})(scalar_function)
+    except Exception:
+        return None
+
+
 def symbolic_to_callable(symbolic_function: Expr) -> Callable:
     """
     Convierte una expresión simbólica de SymPy a una función evaluable con NumPy.
@@ -38,8 +176,41 @@ def symbolic_to_callable(symbolic_function: Expr) -> Callable:
 
     Returns:
         Callable: Función compatible con arrays de NumPy.
+
+    Note:
+        La expresión se reduce antes con `cancel()` si así queda más corta, y las
+        subexpresiones repetidas se calculan una sola vez (`cse=True`), algo frecuente
+        en derivadas e integrales. Se usa el primer motor disponible que soporte la
+        expresión: numexpr (sin tiempo de compilación), un ufunc de `numba.vectorize`,
+        o `lambdify()` con NumPy. Solo en este último caso, al graficar varias funciones,
+        `functions_to_callable()` las agrupa en un único `lambdify()`.
+        El resultado se guarda en una caché LRU, por lo que graficar de nuevo la misma expresión
+        no vuelve a compilarla. Tras cada compilación se limpia `linecache`, donde
+        `lambdify()` registra el código fuente que genera.
     """
-    return lambdify(var_x, symbolic_function, "numpy")
+    callable_function = _cache_get(symbolic_function)
+    if callable_function is None:
+        shrunk = _shrink(symbolic_function)
+        callable_function = _lambdify_numexpr(shrunk)
+        if callable_function is None:
+            callable_function = _vectorize(shrunk)
+        if callable_function is None:
+            callable_function = lambdify(var_x, shrunk, "numpy", cse=True)
+        linecache.clearcache()
+        _cache_put(symbolic_function, callable_function)
+    return callable_function
+
+
+def warm_up():
+    """
+    Prepara una expresión de prueba con el motor de evaluación disponible. Si numba está
+    instalado, además compila un ufunc de prueba: aunque numexpr tenga prioridad, numba se
+    usa para las expresiones que numexpr no soporta (por ejemplo `erf` o `sign`), y así su
+    compilador ya está inicializado en lugar de tardar varios segundos en el primer uso.
+    """
+    symbolic_to_callable(var_x**2)
+    if numba is not None:
+        _vectorize(var_x**2)
 
 
 class Function:
@@ -50,8 +221,8 @@ class Function:
     Se utiliza para abstraer operaciones matemáticas en el proyecto.
 
     Available Methods:
-        - derive(): Retorna una nueva instancia derivada.
-        - integrate(): Retorna una nueva instancia integrada.
+        - derive(): Retorna la instancia derivada.
+        - integrate(): Retorna la instancia integrada.
         - evaluate(x_vals): Evalúa la función para los valores dados.
 
     Example:
@@ -71,31 +242,56 @@ class Function:
         Attributes:
             symbolic_function (sympy.Expr): Expresión simbólica.
             color (str): Color de la gráfica.
-            callable_function (Callable): Versión evaluable con NumPy.
+            callable_function (Callable): Versión evaluable con NumPy, construida al usarse por primera vez.
         """
         self.color = color
         self.symbolic_function = symbolic_function
-        self.callable_function = symbolic_to_callable(symbolic_function)
+        # Derivada e integral ya calculadas, para no repetir el trabajo simbólico
+        self._derived = None
+        self._integrated = None
+
+    @functools.cached_property
+    def callable_function(self) -> Callable:
+        """
+        Versión evaluable con NumPy. Se construye solo si la función se evalúa por separado,
+        ya que al graficar varias funciones juntas se usa `functions_to_callable()`.
+        """
+        if not self.symbolic_function.free_symbols:
+            # Las constantes no necesitan lambdify y deben devolver un array, no un escalar
+            value = float(self.symbolic_function)
+            return lambda x: np.full(np.shape(x), value)
+        return symbolic_to_callable(self.symbolic_function)
 
     def derive(self) -> "Function":
         """
-        Deriva la función simbólica.
+        Deriva la función simbólica. El resultado se calcula una sola vez por instancia.
 
         Returns:
-            Function: Nueva instancia de la función derivada.
+            Function: Instancia de la función derivada.
         """
-        derived = diff(self.symbolic_function, var_x)
-        return Function(derived, color="red")
+        if self._derived is None:
+            self._derived = Function(diff(self.symbolic_function, var_x), color="red")
+        return self._derived
 
     def integrate(self) -> "Function":
         """
-        Integra la función simbólica.
+        Integra la función simbólica. El resultado se calcula una sola vez por instancia.
+
+        Las integrales pequeñas se simplifican (con `ratio=1.7` para no agrandarlas);
+        las grandes se dejan tal cual, porque `simplify()` puede tardar demasiado en ellas.
 
         Returns:
-            Function: Nueva instancia con la función integrada.
+            Function: Instancia con la función integrada.
         """
-        integral = integrate(self.symbolic_function, var_x)
-        return Function(integral, color="green")
+        if self._integrated is None:
+            integral = integrate(self.symbolic_function, var_x)
+            if not integral.has(Integral) and count_ops(integral) <= _MAX_SIMPLIFY_OPS:
+                try:
+                    integral = simplify(integral, ratio=1.7)
+                except Exception:
+                    pass
+            self._integrated = Function(integral, color="green")
+        return self._integrated
 
     def evaluate(self, x_vals: list | np.ndarray) -> np.ndarray:
         """
@@ -110,6 +306,70 @@ class Function:
         return self.callable_function(x_vals)
 
 
+def _lambdify_batch(symbolic_functions: tuple[Expr, ...]) -> Callable:
+    """
+    Convierte varias expresiones simbólicas en una sola función evaluable con NumPy.
+
+    Args:
+        symbolic_functions (tuple[sympy.Expr, ...]): Expresiones simbólicas.
+
+    Returns:
+        Callable: Función que retorna un array con una fila por expresión.
+    """
+    batch_function = lambdify(var_x, [_shrink(expr) for expr in symbolic_functions], "numpy", cse=True)
+    linecache.clearcache()
+
+    def evaluate(x_vals: list | np.ndarray) -> np.ndarray:
+        shape = np.shape(x_vals)
+        # Las expresiones constantes devuelven un escalar que se expande a la forma de x
+        return np.stack([np.broadcast_to(values, shape) for values in batch_function(x_vals)])
+
+    # Se evalúa una vez para detectar funciones que NumPy no soporta
+    with np.errstate(all="ignore"):
+        evaluate(np.ones(1))
+    return evaluate
+
+
+def functions_to_callable(functions: list[Function]) -> Callable:
+    """
+    Construye una única función evaluable para una lista de funciones.
+
+    Si numexpr o numba están instalados, cada función usa su propia versión evaluable
+    (`symbolic_to_callable()`), con el mismo orden de motores que una función sola.
+    Si solo está NumPy, con varias funciones (por ejemplo, la función, su derivada y su
+    integral) se compila un solo `lambdify()`, que comparte las subexpresiones comunes
+    entre todas ellas; si NumPy no soporta alguna expresión, cada función se evalúa por separado.
+
+    Toda la compilación ocurre aquí y no al evaluar, para que pueda hacerse fuera del
+    hilo de la interfaz.
+
+    Args:
+        functions (list[Function]): Funciones a evaluar.
+
+    Returns:
+        Callable: Función que recibe los valores de x y retorna un array de forma (len(functions), len(x)).
+    """
+    if len(functions) == 1:
+        single_function = functions[0].callable_function
+        return lambda x_vals: single_function(x_vals)[np.newaxis]
+
+    if numexpr is not None or numba is not None:
+        # Los motores rápidos evalúan una expresión a la vez: no se agrupan
+        callables = [function.callable_function for function in functions]
+        return lambda x_vals: np.stack([function(x_vals) for function in callables])
+
+    symbolic_functions = tuple(function.symbolic_function for function in functions)
+    callable_function = _cache_get(symbolic_functions)
+    if callable_function is None:
+        try:
+            callable_function = _lambdify_batch(symbolic_functions)
+        except Exception:
+            callables = [function.callable_function for function in functions]
+            callable_function = lambda x_vals: np.stack([function(x_vals) for function in callables])
+        _cache_put(symbolic_functions, callable_function)
+    return callable_function
+
+
 class FigureBuilder:
     """
     Clase encargada de construir y gestionar una figura de Matplotlib para la representación de funciones matemáticas.
@@ -118,7 +378,8 @@ class FigureBuilder:
 
     Available Methods:
         - plot_function(functions: list[Function]): Dibuja una o más funciones sobre el eje.
-        - clear(): Limpia el gráfico y restablece su configuración inicial.
+        - clear(): Borra las funciones graficadas sin reconstruir la figura.
+        - get_artists(): Devuelve los elementos que cambian al graficar, para redibujarlos por separado.
         - get_figure(): Devuelve el objeto Figure para su incrustación en la GUI.
 
     Example:
@@ -134,14 +395,26 @@ class FigureBuilder:
         Attributes:
             figure (Figure): Objeto Figure de Matplotlib que contiene el gráfico.
             axe (Axes): Subgráfico donde se dibujan las funciones y los ejes.
+
+        Note:
+            Cada función se dibuja en una línea (Line2D) que se reutiliza en los siguientes
+            graficados, en lugar de reconstruir los ejes desde cero. Se usan líneas y no un
+            LineCollection porque la leyenda, con `loc="best"`, solo evita los datos de las
+            líneas al elegir su posición. Las curvas y la leyenda son animadas: `draw()` no las dibuja, y la GUI las redibuja con blitting.
         """
         self.figure = mpl_figure.Figure()
         self.axe = self.figure.add_subplot(111)
+        # Puntos de evaluación en x, compartidos por todas las funciones (solo lectura)
+        self._xpoints = np.linspace(-50, 50, 300)
+        self._xpoints.flags.writeable = False
         self._configure_axes()
+        # Líneas reutilizables, una por función; se crean a medida que hacen falta
+        self._lines = []
 
     def _configure_axes(self):
         """
         Configura los ejes del gráfico: etiquetas, límites, rejillas y líneas guía.
+        Se ejecuta una sola vez, al crear la figura; graficar y limpiar no la repiten.
         """
         self.axe.set_xlabel('x')
         self.axe.set_ylabel('f(x)')
@@ -155,23 +428,55 @@ class FigureBuilder:
 
     def plot_function(self, functions: list[Function]):
         """
-        Grafica una lista de funciones sobre el eje actual.
+        Grafica una lista de funciones sobre el eje actual, reemplazando las anteriores.
 
         Args:
             functions (list[Function]): Lista de instancias de la clase Function que serán evaluadas y graficadas.
         """
-        for function in functions:
-            xpoints = np.linspace(-50, 50, 300)
-            ypoints = function.evaluate(xpoints)
-            self.axe.plot(xpoints, ypoints, label=f"${latex(function.symbolic_function)}$", color=function.color)
-        self.axe.legend()
+        # Los NaN e infinitos se conservan para que Matplotlib corte la curva en las asíntotas
+        # en lugar de unirlas
+        ypoints = functions_to_callable(functions)(self._xpoints)
+        while len(self._lines) < len(functions):
+            self._lines.append(self.axe.plot([], [], visible=False, animated=True)[0])
+        for line, function, y in zip(self._lines, functions, ypoints):
+            line.set_data(self._xpoints, y)
+            line.set_color(function.color)
+            line.set_label(f"${latex(function.symbolic_function)}$")
+            line.set_visible(True)
+        self._hide_lines(self._lines[len(functions):])
+        self.axe.legend(handles=self._lines[:len(functions)]).set_animated(True)
+
+    def _hide_lines(self, lines: list):
+        """
+        Oculta las líneas dadas y vacía sus datos, para que la leyenda no los tenga en cuenta
+        al buscar su posición (Matplotlib también considera las líneas ocultas).
+        """
+        for line in lines:
+            line.set_data([], [])
+            line.set_visible(False)
 
     def clear(self):
         """
-        Limpia la figura eliminando los gráficos actuales y restablece la configuración predeterminada de los ejes.
+        Borra las funciones graficadas y oculta su leyenda. La figura, los ejes y las
+        líneas se conservan para el siguiente graficado.
         """
-        self.axe.cla()
-        self._configure_axes()
+        self._hide_lines(self._lines)
+        legend = self.axe.get_legend()
+        if legend is not None:
+            legend.set_visible(False)
+
+    def get_artists(self) -> list:
+        """
+        Retorna las curvas y la leyenda, que no forman parte del fondo estático del gráfico.
+
+        Returns:
+            list[Artist]: Elementos que deben dibujarse sobre el fondo.
+        """
+        artists = [line for line in self._lines if line.get_visible()]
+        legend = self.axe.get_legend()
+        if legend is not None and legend.get_visible():
+            artists.append(legend)
+        return artists
 
     def get_figure(self):
         """
@@ -125,19 +125,38 @@ class GraphicCanvas(tk.Frame):
         super().__init__(parent)
         self.figure_builder = figure_builder
         self.canvas_widget = FigureCanvasTkAgg(self.figure_builder.get_figure(), master=self)
+        # Fondo estático (ejes, rejilla y líneas guía) sobre el que se dibujan las funciones
+        self._background = None
+        self.canvas_widget.mpl_connect("draw_event", self._on_draw)
         self.canvas_widget.draw()
         self.canvas_widget.get_tk_widget().pack()
 
+    def _on_draw(self, event):
+        """
+        Guarda el fondo tras cada dibujado completo (por ejemplo, al redimensionar la ventana)
+        y vuelve a dibujar las funciones encima.
+        """
+        self._background = self.canvas_widget.copy_from_bbox(self.figure_builder.axe.bbox)
+        self._draw_artists()
+
+    def _draw_artists(self):
+        """
+        Dibuja las funciones y la leyenda sobre el fondo guardado.
+        """
+        for artist in self.figure_builder.get_artists():
+            self.figure_builder.axe.draw_artist(artist)
+
     def update_graphic(self):
         """
         Redibuja el contenido del gráfico en la GUI.
         Se utiliza para actualizar la figura cuando se han realizado cambios.
+        Solo se redibujan las funciones sobre el fondo guardado (blitting), sin volver
+        a dibujar ejes, marcas ni rejilla.
         """
-        self.canvas_widget.draw()
-        
-        
-
-        
-        
-        
-        
+        if self._background is None:
+            self.canvas_widget.draw()
+            return
+        self.canvas_widget.restore_region(self._background)
+        self._draw_artists()
+        self.canvas_widget.blit(self.figure_builder.axe.bbox)
+        self.canvas_widget.flush_events()
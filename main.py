@@ -3,54 +3,146 @@ Archivo principal de la aplicación.
 Crea e inicializa la interfaz gráfica del graficador de funciones,
 conectando los componentes visuales y la lógica de graficado simbólico.
 """
+import queue
+import threading
 import tkinter as tk
 from gui_usuario.backend import TitleFrame, InputAndOptions, GraphicCanvas
-from graficar_funciones.backend import Function, string_to_symbolic, FigureBuilder
+from graficar_funciones.backend import Function, string_to_symbolic, FigureBuilder, functions_to_callable, warm_up
+
+#Trabajos pendientes del hilo de trabajo: (función, argumentos, generación o None si no se entrega)
+_TRABAJOS = queue.Queue()
+#Resultados que el hilo principal de Tk recoge periódicamente: (generación, resultado, error)
+_RESULTADOS = queue.Queue()
+#Cada cuántos milisegundos revisa Tk si hay resultados
+_INTERVALO_REVISION_MS = 50
+
+def _trabajador():
+    """
+    Ejecuta en orden los trabajos de la cola (derivar, integrar y compilar) sin bloquear la interfaz.
+    Corre en un hilo daemon: al cerrar la ventana el programa termina sin esperar a que SymPy acabe.
+    """
+    while True:
+        funcion, args, generacion = _TRABAJOS.get()
+        try:
+            resultado, error = funcion(*args), None
+        except Exception as e:
+            resultado, error = None, e
+        if generacion is not None:
+            _RESULTADOS.put((generacion, resultado, error))
+        elif error is not None:
+            print('Error:', error)
 
 def main():
     #Se instancia de la clase Tk.
     root = tk.Tk()
     root.geometry("600x600")
+
+    #Se inicia el hilo de trabajo y se prepara el compilador JIT mientras se construye la interfaz
+    threading.Thread(target=_trabajador, daemon=True).start()
+    _TRABAJOS.put((warm_up, (), None))
     
     #Frame del titulo
     title = TitleFrame(root, "Graficador de funciones")
     title.pack(padx=5, pady=5, fill = 'both', side = 'top', expand = True)
     
-    #Comando que se realiza cuando se presiona el botón 'graficar'
-    def boton_graficar(): 
+    #Última función construida; se reutiliza para no repetir derivadas e integrales
+    funcion_actual = None
+
+    #Datos del último graficado; si no cambian, volver a presionar 'graficar' no hace nada
+    ultima_clave = None
+
+    #Aumenta con cada 'limpiar'; los resultados de trabajos anteriores se descartan
+    generacion_actual = 0
+
+    def olvidar_ultima_clave():
         """
-        Toma los datos del input, convierte la función a simbólica,
-        aplica derivación o integración si se selecciona,
-        y actualiza el gráfico.
+        Permite volver a graficar los mismos datos (tras un error o al limpiar).
         """
-        data = input_frame.get_data()
+        nonlocal ultima_clave
+        ultima_clave = None
+
+    #Operaciones simbólicas que se ejecutan en el hilo de trabajo
+    def construir_funciones(data):
+        """
+        Convierte la función a simbólica y aplica derivación o integración si se selecciona.
+
+        Returns:
+            list[Function]: Funciones listas para graficar.
+        """
+        nonlocal funcion_actual
         funciones = []
+        if data["funcion"]:
+            simb = string_to_symbolic(data["funcion"])
+            if funcion_actual is None or funcion_actual.symbolic_function != simb:
+                funcion_actual = Function(simb)
+            f = funcion_actual
+            funciones.append(f)
+
+            if data["derivar"]:
+                funciones.append(f.derive())
+
+            if data["integrar"]:
+                funciones.append(f.integrate())
+
+            #Se compila aquí; plot_function la reutiliza desde la caché
+            functions_to_callable(funciones)
+        return funciones
+
+    #Actualización del gráfico, siempre en el hilo principal de Tk
+    def aplicar_funciones(funciones):
+        """
+        Grafica las funciones calculadas y actualiza el gráfico.
+        """
         try:
-            if data["funcion"]:
-                simb = string_to_symbolic(data["funcion"])
-                f = Function(simb)
-                funciones.append(f)
-                
-                if data["derivar"]:
-                    funciones.append(f.derive())
-                
-                if data["integrar"]:
-                    funciones.append(f.integrate())
-            
-            
             if funciones:
-                figure.clear()
+                #plot_function reemplaza las curvas anteriores; no hace falta limpiar antes
                 figure.plot_function(funciones)
                 graphic_frame.update_graphic()
-
         except Exception as e:
+            olvidar_ultima_clave()
             print('Error:', e)
+
+    def revisar_resultados():
+        """
+        Recoge en el hilo principal de Tk los resultados del hilo de trabajo y los grafica.
+        """
+        while True:
+            try:
+                generacion, funciones, error = _RESULTADOS.get_nowait()
+            except queue.Empty:
+                break
+            if generacion != generacion_actual:
+                #El gráfico se limpió mientras el trabajo seguía en curso
+                continue
+            if error is not None:
+                print('Error:', error)
+                olvidar_ultima_clave()
+            else:
+                aplicar_funciones(funciones)
+        root.after(_INTERVALO_REVISION_MS, revisar_resultados)
+
+    #Comando que se realiza cuando se presiona el botón 'graficar'
+    def boton_graficar(): 
+        """
+        Toma los datos del input y calcula las funciones en segundo plano,
+        para que la interfaz siga respondiendo mientras SymPy trabaja.
+        """
+        nonlocal ultima_clave
+        data = input_frame.get_data()
+        clave = (data["funcion"], data["derivar"], data["integrar"])
+        if clave == ultima_clave:
+            return
+        ultima_clave = clave
+        _TRABAJOS.put((construir_funciones, (data,), generacion_actual))
             
     #Comando que se realiza cuando se presiona el botón 'limpiar'
     def boton_limpiar():
         """
-        Limpia el gráfico actual.
+        Limpia el gráfico actual y descarta los graficados que aún estén en curso.
         """
+        nonlocal generacion_actual
+        generacion_actual += 1
+        olvidar_ultima_clave()
         try:
             figure.clear()
             graphic_frame.update_graphic()
@@ -67,6 +159,7 @@ def main():
     graphic_frame.pack(padx=5, pady=5, fill='both', expand = True)
     
     #Método principal que inicia el flujo del programa
+    revisar_resultados()
     root.mainloop()
 
 if __name__ == '__main__':